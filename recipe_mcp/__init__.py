@@ -4,16 +4,28 @@ A Model Context Protocol server for extracting recipes from NYT Cooking
 using Playwright browser automation.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Edwin Avalos"
 __email__ = "edwinavalos@example.com"
 
 from .models import Recipe, Ingredient, RecipeMetadata
-from .server import RecipeMCPServer
+
+if TYPE_CHECKING:
+    from .server import RecipeMCPServer
 
 __all__ = [
     "Recipe",
     "Ingredient", 
     "RecipeMetadata",
     "RecipeMCPServer",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the server lazily so model-only users don't load FastMCP and Playwright
+    if name == "RecipeMCPServer":
+        from .server import RecipeMCPServer
+        return RecipeMCPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,20 @@
 
 import asyncio
 import logging
+import os
+import re
 import time
 from typing import Optional, List, Dict, Any
-from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+import orjson
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Page,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
 from bs4 import BeautifulSoup
 
 from .models import (
@@ -20,22 +29,139 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_STORAGE_STATE_PATH = "~/.cache/recipe-mcp/storage_state.json"
+
+# Collects the JSON-LD script bodies in the browser so only they cross the
+# Playwright pipe instead of the whole serialized page
+_JSONLD_SCRIPT = """
+() => Array.from(
+    document.querySelectorAll('script[type="application/ld+json"]'),
+    (script) => script.textContent
+)
+"""
+
+_ISO_DURATION_RE = re.compile(
+    r'^P(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?)?$'
+)
+
+_JSONLD_TIME_FIELDS = {
+    'prepTime': 'prep_time',
+    'cookTime': 'cook_time',
+    'totalTime': 'total_time',
+}
+
+_JSONLD_NUTRITION_FIELDS = {
+    'calories': 'calories',
+    'proteinContent': 'protein',
+    'carbohydrateContent': 'carbohydrates',
+    'fatContent': 'fat',
+    'fiberContent': 'fiber',
+    'sugarContent': 'sugar',
+    'sodiumContent': 'sodium',
+}
+
+_NYT_URL_RE = re.compile(r'https?://cooking\.nytimes\.com/recipes/')
+
+_NUTRITION_LABELS = {
+    'calories': 'calories',
+    'protein': 'protein',
+    'carb': 'carbohydrates',
+    'fat': 'fat',
+    'fiber': 'fiber',
+    'sugar': 'sugar',
+    'sodium': 'sodium',
+}
+
+_NUTRITION_LABEL_RE = re.compile('|'.join(_NUTRITION_LABELS))
+
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+_COUNT_RE = re.compile(r'\d[\d,]*')
+
+_COMMON_UNITS = frozenset({
+    'cup', 'cups', 'c', 'c.',
+    'tablespoon', 'tablespoons', 'tbsp', 'tbsp.', 'tbs', 'tbs.',
+    'teaspoon', 'teaspoons', 'tsp', 'tsp.',
+    'pound', 'pounds', 'lb', 'lb.', 'lbs', 'lbs.',
+    'ounce', 'ounces', 'oz', 'oz.',
+    'gram', 'grams', 'g', 'g.',
+    'kilogram', 'kilograms', 'kg', 'kg.',
+    'liter', 'liters', 'l', 'l.',
+    'milliliter', 'milliliters', 'ml', 'ml.',
+    'pint', 'pints', 'pt', 'pt.',
+    'quart', 'quarts', 'qt', 'qt.',
+    'gallon', 'gallons', 'gal', 'gal.',
+    'inch', 'inches', 'in', 'in.',
+    'clove', 'cloves',
+    'bunch', 'bunches',
+    'head', 'heads',
+    'piece', 'pieces',
+    'slice', 'slices',
+    'can', 'cans',
+    'jar', 'jars',
+    'bottle', 'bottles',
+    'package', 'packages', 'pkg', 'pkg.',
+    'bag', 'bags',
+})
+
+_AMOUNT_PATTERN = r'(?:\d+(?:\.\d*)?|\.\d+|\d*[½¼¾⅓⅔⅛])'
+
+_UNIT_PATTERN = '|'.join(
+    re.escape(unit) for unit in sorted(_COMMON_UNITS, key=len, reverse=True)
+)
+
+# Leading quantity (number, fraction or range), then an optional unit,
+# then the ingredient name; punctuation around tokens is tolerated, and
+# the quantity or unit may end the text (e.g. "2 cups")
+_INGREDIENT_RE = re.compile(
+    rf'(?:(?P<quantity>[.,;]*{_AMOUNT_PATTERN}(?:[-/]{_AMOUNT_PATTERN})?[.,;]*)(?:\s+|$)'
+    rf'(?:(?P<unit>[.,;]*(?:{_UNIT_PATTERN})[.,;]*)(?:\s+|$))?)?'
+    r'(?P<name>.*)',
+    re.IGNORECASE | re.DOTALL
+)
+
+_PARENTHETICAL_RE = re.compile(r'\(([^)]*)\)')
+
 
 class NYTCookingExtractor:
     """Extractor for NYT Cooking recipes using Playwright."""
     
-    def __init__(self, headless: bool = True, debug: bool = False):
+    def __init__(
+        self,
+        headless: bool = True,
+        debug: bool = False,
+        page_pool_size: int = 2,
+        max_page_uses: int = 50,
+        storage_state_path: Optional[str] = DEFAULT_STORAGE_STATE_PATH,
+        block_resources: bool = True
+    ):
         """Initialize the extractor.
         
         Args:
             headless: Run browser in headless mode
             debug: Enable debug logging
+            page_pool_size: Number of reusable pages kept open
+            max_page_uses: Extractions served by a page before it is replaced
+            storage_state_path: File used to persist cookies and storage
+                between runs, or None to always start from a clean context
+            block_resources: Abort image, media, font and stylesheet requests
         """
+        if page_pool_size < 1:
+            raise ValueError(f"page_pool_size must be at least 1, got {page_pool_size}")
+        
         self.headless = headless
         self.debug = debug
+        self.page_pool_size = page_pool_size
+        self.max_page_uses = max_page_uses
+        self.storage_state_path = (
+            os.path.expanduser(storage_state_path) if storage_state_path else None
+        )
+        self.block_resources = block_resources
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._page_uses: Dict[Page, int] = {}
         
         if debug:
             logging.basicConfig(level=logging.DEBUG)
@@ -55,14 +181,43 @@ class NYTCookingExtractor:
                 "--disable-extensions-http-throttling",
                 "--disable-features=TranslateUI",
                 "--disable-ipc-flooding-protection",
+                "--disable-dev-shm-usage",
+                "--disable-gpu",
             ]
         )
         
-        # Create browser context with realistic settings
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        # Create browser context with realistic settings, restoring the
+        # previous session's cookies so NYT skips its first-visit redirects
+        storage_state = None
+        if self.storage_state_path and os.path.exists(self.storage_state_path):
+            storage_state = self.storage_state_path
+        
+        context_options: Dict[str, Any] = {
+            "viewport": {"width": 1920, "height": 1080},
+            "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "accept_downloads": False,
+            "service_workers": "block",
+        }
+        try:
+            self.context = await self.browser.new_context(
+                storage_state=storage_state,
+                **context_options
+            )
+        except Exception as e:
+            if not storage_state:
+                raise
+            logger.warning(f"Ignoring unreadable storage state {storage_state}: {e}")
+            self.context = await self.browser.new_context(**context_options)
+        
+        # Filter at the context level so every page, including recycled
+        # ones, skips resources not needed to read the recipe
+        if self.block_resources:
+            await self.context.route("**/*", self._route_request)
+        
+        # Pre-create pages so extractions don't pay for page setup
+        self._page_pool = asyncio.Queue()
+        for _ in range(self.page_pool_size):
+            self._page_pool.put_nowait(await self._new_page())
         
         logger.info("NYT Cooking extractor started successfully")
     
@@ -70,7 +225,17 @@ class NYTCookingExtractor:
         """Stop the browser and cleanup resources."""
         logger.info("Stopping NYT Cooking extractor")
         
+        # Pooled pages are closed along with their context
+        self._page_pool = None
+        self._page_uses.clear()
+        
         if self.context:
+            if self.storage_state_path:
+                try:
+                    await self._save_storage_state()
+                except Exception as e:
+                    logger.warning(f"Failed to save storage state: {e}")
+            
             await self.context.close()
             self.context = None
         
@@ -84,6 +249,22 @@ class NYTCookingExtractor:
         
         logger.info("NYT Cooking extractor stopped")
     
+    async def _save_storage_state(self) -> None:
+        """Write the context's cookies and storage to storage_state_path.
+        
+        The file holds session cookies, so it is only readable by the owner.
+        """
+        state = await self.context.storage_state()
+        
+        directory = os.path.dirname(self.storage_state_path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        
+        fd = os.open(self.storage_state_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            # The mode above only applies when the file is created
+            os.chmod(self.storage_state_path, 0o600)
+            f.write(orjson.dumps(state))
+    
     async def extract_recipe(
         self,
         url: str,
@@ -104,7 +285,7 @@ class NYTCookingExtractor:
         """
         start_time = time.time()
         
-        if not self.context:
+        if not self.context or self._page_pool is None:
             return ExtractionResult(
                 success=False,
                 error="Extractor not started",
@@ -120,14 +301,29 @@ class NYTCookingExtractor:
             )
         
         page = None
+        checked_out = False
         try:
             logger.info(f"Extracting recipe from: {url}")
             
-            # Create new page
-            page = await self.context.new_page()
+            # Check out a page from the pool, bounded so a starved pool
+            # can't leave callers waiting forever
+            try:
+                page = await asyncio.wait_for(self._page_pool.get(), timeout)
+            except asyncio.TimeoutError:
+                return ExtractionResult(
+                    success=False,
+                    error=f"Timed out after {timeout}s waiting for a browser page",
+                    extraction_time=time.time() - start_time
+                )
+            checked_out = True
             
-            # Navigate to recipe page
-            response = await page.goto(url, timeout=timeout * 1000, wait_until="networkidle")
+            # An empty slot means a previous page couldn't be replaced
+            if page is None:
+                page = await self._new_page()
+            
+            # Navigate to recipe page; the recipe header wait below is the
+            # readiness gate, so don't wait for the network to go idle
+            response = await page.goto(url, timeout=timeout * 1000, wait_until="domcontentloaded")
             
             if not response or response.status >= 400:
                 return ExtractionResult(
@@ -198,7 +394,11 @@ class NYTCookingExtractor:
             )
             
         except Exception as e:
-            logger.exception("Failed to extract recipe")
+            # Timeouts are an expected failure mode; skip the traceback
+            if isinstance(e, PlaywrightTimeoutError):
+                logger.error(f"Timed out extracting recipe from {url}: {e}")
+            else:
+                logger.exception("Failed to extract recipe")
             return ExtractionResult(
                 success=False,
                 error=f"Extraction error: {str(e)}",
@@ -206,19 +406,99 @@ class NYTCookingExtractor:
             )
         
         finally:
-            if page:
+            if checked_out:
+                await self._release_page(page)
+    
+    async def extract_many(
+        self,
+        urls: List[str],
+        include_nutrition: bool = True,
+        include_reviews: bool = False,
+        timeout: int = 30,
+        concurrency: Optional[int] = None
+    ) -> List[ExtractionResult]:
+        """Extract several recipes concurrently.
+        
+        Args:
+            urls: Recipe URLs to extract
+            include_nutrition: Whether to extract nutrition info
+            include_reviews: Whether to extract review info
+            timeout: Timeout in seconds per recipe
+            concurrency: Maximum number of extractions in flight; defaults to
+                the page pool size
+            
+        Returns:
+            ExtractionResults in the same order as urls
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.page_pool_size)
+        
+        async def extract_one(url: str) -> ExtractionResult:
+            # Invalid URLs fail fast without waiting for a slot
+            if not self._is_valid_nyt_url(url):
+                return await self.extract_recipe(url)
+            
+            async with semaphore:
+                return await self.extract_recipe(
+                    url,
+                    include_nutrition=include_nutrition,
+                    include_reviews=include_reviews,
+                    timeout=timeout
+                )
+        
+        return list(await asyncio.gather(*(extract_one(url) for url in urls)))
+    
+    async def _new_page(self) -> Page:
+        """Create a page for the pool."""
+        return await self.context.new_page()
+    
+    async def _release_page(self, page: Optional[Page]) -> None:
+        """Reset a page and return it to the pool.
+        
+        A page that can't be replaced leaves an empty slot (None) in the
+        pool, so the next checkout creates one instead of the pool shrinking.
+        """
+        pool = self._page_pool
+        if pool is None:
+            return
+        
+        if page is None:
+            pool.put_nowait(None)
+            return
+        
+        uses = self._page_uses.pop(page, 0) + 1
+        
+        try:
+            if page.is_closed():
+                page, uses = await self._new_page(), 0
+            elif uses >= self.max_page_uses:
+                # Recycle long-lived pages to shed accumulated renderer memory
                 await page.close()
+                page, uses = await self._new_page(), 0
+            else:
+                await page.goto("about:blank")
+        except Exception as e:
+            logger.debug(f"Replacing unusable page: {e}")
+            try:
+                await page.close()
+                page, uses = await self._new_page(), 0
+            except Exception:
+                logger.exception("Failed to replace pooled page")
+                pool.put_nowait(None)
+                return
+        
+        self._page_uses[page] = uses
+        pool.put_nowait(page)
+    
+    async def _route_request(self, route: Route) -> None:
+        """Abort requests for resources not needed to read the recipe."""
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
     
     def _is_valid_nyt_url(self, url: str) -> bool:
         """Check if URL is a valid NYT Cooking recipe URL."""
-        try:
-            parsed = urlparse(url)
-            return (
-                parsed.netloc == "cooking.nytimes.com" and
-                parsed.path.startswith("/recipes/")
-            )
-        except Exception:
-            return False
+        return _NYT_URL_RE.match(url) is not None
     
     async def _extract_recipe_data(
         self, 
@@ -237,97 +517,314 @@ class NYTCookingExtractor:
             Dictionary with extracted recipe data
         """
         try:
-            # Get page content
+            # Prefer the structured schema.org payload when the page has one
+            payloads = await page.evaluate(_JSONLD_SCRIPT)
+            try:
+                recipe_data = self._extract_jsonld(
+                    payloads,
+                    include_nutrition=include_nutrition,
+                    include_reviews=include_reviews
+                )
+            except Exception as e:
+                # A malformed payload shouldn't stop us reading the page itself
+                logger.debug(f"Failed to extract JSON-LD recipe data: {e}")
+                recipe_data = None
+            if recipe_data:
+                return recipe_data
+
+            # Fall back to scraping the rendered page; parsing a full page is
+            # CPU-bound, so keep it off the event loop
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            recipe_data = {}
-            
-            # Extract title
-            title_elem = soup.find('h1', {'data-testid': 'recipe-title'})
-            if title_elem:
-                recipe_data['title'] = title_elem.get_text(strip=True)
-            
-            # Extract author
-            author_elem = soup.find('span', {'data-testid': 'recipe-author'})
-            if author_elem:
-                recipe_data['author'] = author_elem.get_text(strip=True)
-            
-            # Extract description
-            desc_elem = soup.find('div', {'data-testid': 'recipe-summary'})
-            if desc_elem:
-                recipe_data['description'] = desc_elem.get_text(strip=True)
-            
-            # Extract timing information
-            timing_section = soup.find('section', {'data-testid': 'recipe-timing'})
-            if timing_section:
-                timing_items = timing_section.find_all('div', class_='recipe-time-item')
-                for item in timing_items:
-                    label = item.find('dt')
-                    value = item.find('dd')
-                    if label and value:
-                        label_text = label.get_text(strip=True).lower()
-                        if 'prep' in label_text:
-                            recipe_data['prep_time'] = value.get_text(strip=True)
-                        elif 'cook' in label_text:
-                            recipe_data['cook_time'] = value.get_text(strip=True)
-                        elif 'total' in label_text:
-                            recipe_data['total_time'] = value.get_text(strip=True)
-            
-            # Extract servings
-            servings_elem = soup.find('[data-testid="recipe-servings"]')
-            if servings_elem:
-                recipe_data['servings'] = servings_elem.get_text(strip=True)
-            
-            # Extract ingredients
-            ingredients = []
-            ingredient_sections = soup.find_all('[data-testid="recipe-ingredient"]')
-            for ingredient_elem in ingredient_sections:
-                ingredient_text = ingredient_elem.get_text(strip=True)
-                if ingredient_text:
-                    ingredients.append(ingredient_text)
-            
-            recipe_data['ingredients'] = ingredients
-            
-            # Extract instructions
-            instructions = []
-            instruction_sections = soup.find_all('[data-testid="recipe-instruction"]')
-            for instruction_elem in instruction_sections:
-                instruction_text = instruction_elem.get_text(strip=True)
-                if instruction_text:
-                    instructions.append(instruction_text)
-            
-            recipe_data['instructions'] = instructions
-            
-            # Extract tags
-            tags = []
-            tag_elements = soup.find_all('a', class_='tag-link')
-            for tag_elem in tag_elements:
-                tag_text = tag_elem.get_text(strip=True)
-                if tag_text:
-                    tags.append(tag_text)
-            
-            recipe_data['tags'] = tags
-            
-            # Extract nutrition info if requested
-            if include_nutrition:
-                nutrition_data = await self._extract_nutrition_info(soup)
-                if nutrition_data:
-                    recipe_data['nutrition'] = nutrition_data
-            
-            # Extract review info if requested
-            if include_reviews:
-                review_data = await self._extract_review_info(soup)
-                if review_data:
-                    recipe_data.update(review_data)
-            
-            return recipe_data
+            return await asyncio.to_thread(
+                self._parse_recipe_html,
+                content,
+                include_nutrition,
+                include_reviews
+            )
             
         except Exception as e:
             logger.exception("Failed to extract recipe data from page")
             return None
     
-    async def _extract_nutrition_info(self, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    def _parse_recipe_html(
+        self,
+        content: str,
+        include_nutrition: bool = True,
+        include_reviews: bool = False
+    ) -> Dict[str, Any]:
+        """Extract recipe data from the page's rendered HTML.
+        
+        Args:
+            content: Page HTML
+            include_nutrition: Extract nutrition information
+            include_reviews: Extract review information
+            
+        Returns:
+            Dictionary with extracted recipe data
+        """
+        soup = BeautifulSoup(content, 'lxml')
+        
+        recipe_data = {}
+        
+        # Extract title
+        title_elem = soup.find('h1', {'data-testid': 'recipe-title'})
+        if title_elem:
+            recipe_data['title'] = title_elem.get_text(strip=True)
+        
+        # Extract author
+        author_elem = soup.find('span', {'data-testid': 'recipe-author'})
+        if author_elem:
+            recipe_data['author'] = author_elem.get_text(strip=True)
+        
+        # Extract description
+        desc_elem = soup.find('div', {'data-testid': 'recipe-summary'})
+        if desc_elem:
+            recipe_data['description'] = desc_elem.get_text(strip=True)
+        
+        # Extract timing information
+        timing_section = soup.find('section', {'data-testid': 'recipe-timing'})
+        if timing_section:
+            timing_items = timing_section.find_all('div', class_='recipe-time-item')
+            for item in timing_items:
+                label = item.find('dt')
+                value = item.find('dd')
+                if label and value:
+                    label_text = label.get_text(strip=True).lower()
+                    if 'prep' in label_text:
+                        recipe_data['prep_time'] = value.get_text(strip=True)
+                    elif 'cook' in label_text:
+                        recipe_data['cook_time'] = value.get_text(strip=True)
+                    elif 'total' in label_text:
+                        recipe_data['total_time'] = value.get_text(strip=True)
+        
+        # Extract servings
+        servings_elem = soup.select_one('[data-testid="recipe-servings"]')
+        if servings_elem:
+            recipe_data['servings'] = servings_elem.get_text(strip=True)
+        
+        # Extract ingredients
+        ingredients = []
+        ingredient_sections = soup.select('[data-testid="recipe-ingredient"]')
+        for ingredient_elem in ingredient_sections:
+            ingredient_text = ingredient_elem.get_text(strip=True)
+            if ingredient_text:
+                ingredients.append(ingredient_text)
+        
+        recipe_data['ingredients'] = ingredients
+        
+        # Extract instructions
+        instructions = []
+        instruction_sections = soup.select('[data-testid="recipe-instruction"]')
+        for instruction_elem in instruction_sections:
+            instruction_text = instruction_elem.get_text(strip=True)
+            if instruction_text:
+                instructions.append(instruction_text)
+        
+        recipe_data['instructions'] = instructions
+        
+        # Extract tags
+        tags = []
+        tag_elements = soup.find_all('a', class_='tag-link')
+        for tag_elem in tag_elements:
+            tag_text = tag_elem.get_text(strip=True)
+            if tag_text:
+                tags.append(tag_text)
+        
+        recipe_data['tags'] = tags
+        
+        # Extract nutrition info if requested
+        if include_nutrition:
+            nutrition_data = self._extract_nutrition_info(soup)
+            if nutrition_data:
+                recipe_data['nutrition'] = nutrition_data
+        
+        # Extract review info if requested
+        if include_reviews:
+            review_data = self._extract_review_info(soup)
+            if review_data:
+                recipe_data.update(review_data)
+        
+        return recipe_data
+    
+    def _extract_jsonld(
+        self,
+        payloads: List[str],
+        include_nutrition: bool = True,
+        include_reviews: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Extract recipe data from the page's schema.org JSON-LD payload.
+        
+        Args:
+            payloads: Text of the page's application/ld+json scripts
+            include_nutrition: Extract nutrition information
+            include_reviews: Extract review information
+            
+        Returns:
+            Dictionary with extracted recipe data, or None if the page has
+            no usable Recipe object
+        """
+        recipe = None
+        for text in payloads:
+            try:
+                payload = orjson.loads(text)
+            except (TypeError, ValueError):
+                continue
+            recipe = self._find_jsonld_recipe(payload)
+            if recipe:
+                break
+        
+        if not recipe:
+            return None
+        
+        # schema.org allows a single Text in place of a list
+        ingredients = recipe.get('recipeIngredient')
+        if isinstance(ingredients, str):
+            ingredients = [ingredients]
+        if not isinstance(ingredients, list):
+            return None
+        ingredients = [
+            ingredient.strip()
+            for ingredient in ingredients
+            if isinstance(ingredient, str) and ingredient.strip()
+        ]
+        if not ingredients:
+            return None
+        
+        recipe_data: Dict[str, Any] = {}
+        
+        if isinstance(recipe.get('name'), str) and recipe['name']:
+            recipe_data['title'] = recipe['name']
+        
+        author = recipe.get('author')
+        if isinstance(author, list):
+            author = author[0] if author else None
+        if isinstance(author, dict):
+            author = author.get('name')
+        if isinstance(author, str) and author:
+            recipe_data['author'] = author
+        
+        if isinstance(recipe.get('description'), str) and recipe['description']:
+            recipe_data['description'] = recipe['description']
+        
+        for key, field in _JSONLD_TIME_FIELDS.items():
+            if isinstance(recipe.get(key), str) and recipe[key]:
+                recipe_data[field] = self._format_duration(recipe[key])
+        
+        servings = recipe.get('recipeYield')
+        if isinstance(servings, list):
+            servings = servings[0] if servings else None
+        if isinstance(servings, (str, int, float)) and servings:
+            recipe_data['servings'] = str(servings)
+        
+        recipe_data['ingredients'] = ingredients
+        recipe_data['instructions'] = self._flatten_jsonld_instructions(
+            recipe.get('recipeInstructions', [])
+        )
+        
+        keywords = recipe.get('keywords') or []
+        if isinstance(keywords, str):
+            keywords = keywords.split(',')
+        elif not isinstance(keywords, list):
+            keywords = []
+        recipe_data['tags'] = [
+            tag.strip() for tag in keywords if isinstance(tag, str) and tag.strip()
+        ]
+        
+        nutrition = recipe.get('nutrition')
+        if include_nutrition and isinstance(nutrition, dict):
+            nutrition_data: Dict[str, Any] = {}
+            for key, field in _JSONLD_NUTRITION_FIELDS.items():
+                value = nutrition.get(key)
+                if not value:
+                    continue
+                if field == 'calories':
+                    try:
+                        nutrition_data['calories'] = int(float(str(value).split()[0]))
+                    except (ValueError, IndexError, OverflowError):
+                        pass
+                else:
+                    nutrition_data[field] = str(value)
+            if nutrition_data:
+                recipe_data['nutrition'] = nutrition_data
+        
+        rating = recipe.get('aggregateRating')
+        if include_reviews and isinstance(rating, dict):
+            try:
+                recipe_data['rating'] = float(rating['ratingValue'])
+            except (KeyError, TypeError, ValueError):
+                pass
+            try:
+                count = rating.get('reviewCount', rating.get('ratingCount'))
+                recipe_data['review_count'] = int(count)
+            except (TypeError, ValueError):
+                pass
+        
+        return recipe_data
+    
+    def _find_jsonld_recipe(self, payload: Any) -> Optional[Dict[str, Any]]:
+        """Find the first schema.org Recipe object in a JSON-LD payload."""
+        if isinstance(payload, list):
+            for item in payload:
+                recipe = self._find_jsonld_recipe(item)
+                if recipe:
+                    return recipe
+            return None
+        
+        if not isinstance(payload, dict):
+            return None
+        
+        types = payload.get('@type')
+        if isinstance(types, str):
+            types = [types]
+        if types and 'Recipe' in types:
+            return payload
+        
+        if '@graph' in payload:
+            return self._find_jsonld_recipe(payload['@graph'])
+        
+        return None
+    
+    def _flatten_jsonld_instructions(self, steps: Any) -> List[str]:
+        """Flatten HowToStep/HowToSection instructions into plain strings."""
+        if isinstance(steps, str):
+            return [line.strip() for line in steps.splitlines() if line.strip()]
+        
+        instructions = []
+        for step in steps if isinstance(steps, list) else []:
+            if isinstance(step, str):
+                text = step
+            elif isinstance(step, dict) and 'itemListElement' in step:
+                instructions.extend(
+                    self._flatten_jsonld_instructions(step['itemListElement'])
+                )
+                continue
+            elif isinstance(step, dict):
+                text = step.get('text') or ''
+            else:
+                continue
+            
+            text = text.strip()
+            if text:
+                instructions.append(text)
+        
+        return instructions
+    
+    def _format_duration(self, value: str) -> str:
+        """Convert an ISO 8601 duration like PT1H30M into readable text."""
+        match = _ISO_DURATION_RE.match(value)
+        if not match:
+            return value
+        
+        parts = []
+        for unit in ('days', 'hours', 'minutes'):
+            amount = int(match.group(unit) or 0)
+            if amount:
+                label = unit if amount != 1 else unit[:-1]
+                parts.append(f"{amount} {label}")
+        
+        return ' '.join(parts) if parts else value
+    
+    def _extract_nutrition_info(self, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
         """Extract nutrition information from the page."""
         try:
             nutrition_section = soup.find('section', {'data-testid': 'nutrition-summary'})
@@ -339,30 +836,26 @@ class NYTCookingExtractor:
             # Look for common nutrition fields
             nutrition_items = nutrition_section.find_all('div', class_='nutrition-item')
             for item in nutrition_items:
-                label = item.find('dt') or item.find('.nutrition-label')
-                value = item.find('dd') or item.find('.nutrition-value')
+                label = item.find('dt') or item.select_one('.nutrition-label')
+                value = item.find('dd') or item.select_one('.nutrition-value')
                 
                 if label and value:
-                    label_text = label.get_text(strip=True).lower()
+                    label_match = _NUTRITION_LABEL_RE.search(
+                        label.get_text(strip=True).lower()
+                    )
+                    if not label_match:
+                        continue
+                    
+                    field = _NUTRITION_LABELS[label_match.group()]
                     value_text = value.get_text(strip=True)
                     
-                    if 'calories' in label_text:
+                    if field == 'calories':
                         try:
                             nutrition_data['calories'] = int(value_text.split()[0])
                         except (ValueError, IndexError):
                             pass
-                    elif 'protein' in label_text:
-                        nutrition_data['protein'] = value_text
-                    elif 'carb' in label_text:
-                        nutrition_data['carbohydrates'] = value_text
-                    elif 'fat' in label_text:
-                        nutrition_data['fat'] = value_text
-                    elif 'fiber' in label_text:
-                        nutrition_data['fiber'] = value_text
-                    elif 'sugar' in label_text:
-                        nutrition_data['sugar'] = value_text
-                    elif 'sodium' in label_text:
-                        nutrition_data['sodium'] = value_text
+                    else:
+                        nutrition_data[field] = value_text
             
             return nutrition_data if nutrition_data else None
             
@@ -370,13 +863,13 @@ class NYTCookingExtractor:
             logger.debug(f"Failed to extract nutrition info: {e}")
             return None
     
-    async def _extract_review_info(self, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    def _extract_review_info(self, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
         """Extract review information from the page."""
         try:
             review_data = {}
             
             # Extract rating
-            rating_elem = soup.find('[data-testid="recipe-rating"]')
+            rating_elem = soup.select_one('[data-testid="recipe-rating"]')
             if rating_elem:
                 rating_text = rating_elem.get_text(strip=True)
                 try:
@@ -387,16 +880,13 @@ class NYTCookingExtractor:
                     pass
             
             # Extract review count
-            review_count_elem = soup.find('[data-testid="recipe-review-count"]')
+            review_count_elem = soup.select_one('[data-testid="recipe-review-count"]')
             if review_count_elem:
                 count_text = review_count_elem.get_text(strip=True)
-                try:
-                    # Extract number from text like "1,234 reviews"
-                    count_str = ''.join(filter(str.isdigit, count_text))
-                    if count_str:
-                        review_data['review_count'] = int(count_str)
-                except (ValueError, IndexError):
-                    pass
+                # Extract number from text like "1,234 reviews"
+                count_match = _COUNT_RE.search(count_text)
+                if count_match:
+                    review_data['review_count'] = int(count_match.group().replace(',', ''))
             
             return review_data if review_data else None
             
@@ -416,113 +906,32 @@ class NYTCookingExtractor:
         # This is a simplified parser - could be enhanced with more sophisticated NLP
         text = ingredient_text.strip()
         
-        # Try to extract quantity, unit, and name
-        words = text.split()
+        # Split off quantity and unit in a single regex pass
+        match = _INGREDIENT_RE.match(text)
+        if not match:
+            return Ingredient.model_construct(name=text, raw_text=ingredient_text)
         
-        quantity = None
-        unit = None
-        name = text
+        quantity = match.group('quantity')
+        unit = match.group('unit')
+        name = match.group('name').strip()
         preparation = None
         
-        # Look for quantity at the beginning
-        if words and self._looks_like_quantity(words[0]):
-            quantity = words[0]
-            remaining_words = words[1:]
-            
-            # Look for unit after quantity
-            if remaining_words and self._looks_like_unit(remaining_words[0]):
-                unit = remaining_words[0]
-                name_words = remaining_words[1:]
-            else:
-                name_words = remaining_words
-            
-            if name_words:
-                name = ' '.join(name_words)
-        
         # Look for preparation notes in parentheses or after comma
-        if '(' in text and ')' in text:
-            start = text.find('(')
-            end = text.find(')', start)
-            if start < end:
-                preparation = text[start+1:end].strip()
-                name = (text[:start] + text[end+1:]).strip()
-        elif ',' in text:
-            parts = text.split(',', 1)
-            if len(parts) == 2 and len(parts[1].strip()) < 50:  # Likely preparation note
-                name = parts[0].strip()
-                preparation = parts[1].strip()
-        
-        return Ingredient(
-            name=name,
+        parenthetical = _PARENTHETICAL_RE.search(name)
+        if parenthetical:
+            preparation = parenthetical.group(1).strip() or None
+            name = (name[:parenthetical.start()] + name[parenthetical.end():]).strip()
+        elif ',' in name:
+            head, _, tail = name.partition(',')
+            if len(tail.strip()) < 50:  # Likely preparation note
+                name = head.strip()
+                preparation = tail.strip()
+        
+        # Every field is a string produced above, so skip re-validation
+        return Ingredient.model_construct(
+            name=name or text,
             quantity=quantity,
             unit=unit,
             preparation=preparation,
             raw_text=ingredient_text
         )
-    
-    def _looks_like_quantity(self, word: str) -> bool:
-        """Check if word looks like a quantity."""
-        # Handle fractions, decimals, and ranges
-        word = word.replace('½', '0.5').replace('¼', '0.25').replace('¾', '0.75')
-        word = word.replace('⅓', '0.33').replace('⅔', '0.67').replace('⅛', '0.125')
-        
-        # Remove common punctuation
-        word = word.strip('.,;')
-        
-        try:
-            float(word)
-            return True
-        except ValueError:
-            # Check for fractions like "1/2"
-            if '/' in word:
-                parts = word.split('/')
-                if len(parts) == 2:
-                    try:
-                        float(parts[0])
-                        float(parts[1])
-                        return True
-                    except ValueError:
-                        pass
-            
-            # Check for ranges like "2-3"
-            if '-' in word:
-                parts = word.split('-')
-                if len(parts) == 2:
-                    try:
-                        float(parts[0])
-                        float(parts[1])
-                        return True
-                    except ValueError:
-                        pass
-        
-        return False
-    
-    def _looks_like_unit(self, word: str) -> bool:
-        """Check if word looks like a measurement unit."""
-        common_units = {
-            'cup', 'cups', 'c', 'c.',
-            'tablespoon', 'tablespoons', 'tbsp', 'tbsp.', 'tbs', 'tbs.',
-            'teaspoon', 'teaspoons', 'tsp', 'tsp.', 'tsp',
-            'pound', 'pounds', 'lb', 'lb.', 'lbs', 'lbs.',
-            'ounce', 'ounces', 'oz', 'oz.',
-            'gram', 'grams', 'g', 'g.',
-            'kilogram', 'kilograms', 'kg', 'kg.',
-            'liter', 'liters', 'l', 'l.',
-            'milliliter', 'milliliters', 'ml', 'ml.',
-            'pint', 'pints', 'pt', 'pt.',
-            'quart', 'quarts', 'qt', 'qt.',
-            'gallon', 'gallons', 'gal', 'gal.',
-            'inch', 'inches', 'in', 'in.',
-            'clove', 'cloves',
-            'bunch', 'bunches',
-            'head', 'heads',
-            'piece', 'pieces',
-            'slice', 'slices',
-            'can', 'cans',
-            'jar', 'jars',
-            'bottle', 'bottles',
-            'package', 'packages', 'pkg', 'pkg.',
-            'bag', 'bags'
-        }
-        
-        return word.lower().strip('.,;') in common_units
\ No newline at end of file
@@ -5,6 +5,15 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, HttpUrl
 
 
+_KEEP_NOTE_TEMPLATE = (
+    "**{title}**\n\n"
+    "**Ingredients:**\n{ingredients}\n\n"
+    "**Instructions:**\n{instructions}"
+    "{time_block}{servings_block}{notes_block}\n\n"
+    "**Source:** {source_url}"
+)
+
+
 class Ingredient(BaseModel):
     """Represents a recipe ingredient."""
     
@@ -57,46 +66,34 @@ class Recipe(BaseModel):
     notes: List[str] = Field(default_factory=list, description="Additional notes")
     equipment: List[str] = Field(default_factory=list, description="Required equipment")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-    
     def to_google_keep_format(self) -> Dict[str, Any]:
         """Convert recipe to Google Keep-friendly format."""
-        ingredients_text = "\n".join([
-            f"• {ingredient.raw_text}" for ingredient in self.ingredients
-        ])
-        
-        instructions_text = "\n".join([
-            f"{i+1}. {instruction}" 
-            for i, instruction in enumerate(self.instructions)
-        ])
-        
-        note_content = f"""**{self.metadata.title}**
-
-**Ingredients:**
-{ingredients_text}
-
-**Instructions:**
-{instructions_text}"""
-        
-        if self.metadata.prep_time or self.metadata.cook_time:
-            times = []
-            if self.metadata.prep_time:
-                times.append(f"Prep: {self.metadata.prep_time}")
-            if self.metadata.cook_time:
-                times.append(f"Cook: {self.metadata.cook_time}")
-            note_content += f"\n\n**Time:** {' | '.join(times)}"
+        times = []
+        if self.metadata.prep_time:
+            times.append(f"Prep: {self.metadata.prep_time}")
+        if self.metadata.cook_time:
+            times.append(f"Cook: {self.metadata.cook_time}")
         
-        if self.metadata.servings:
-            note_content += f"\n**Servings:** {self.metadata.servings}"
-        
-        if self.notes:
-            note_content += f"\n\n**Notes:**\n" + "\n".join([f"• {note}" for note in self.notes])
-        
-        note_content += f"\n\n**Source:** {self.metadata.source_url}"
+        note_content = _KEEP_NOTE_TEMPLATE.format_map({
+            "title": self.metadata.title,
+            "ingredients": "\n".join(
+                f"• {ingredient.raw_text}" for ingredient in self.ingredients
+            ),
+            "instructions": "\n".join(
+                f"{i}. {instruction}"
+                for i, instruction in enumerate(self.instructions, 1)
+            ),
+            "time_block": f"\n\n**Time:** {' | '.join(times)}" if times else "",
+            "servings_block": (
+                f"\n**Servings:** {self.metadata.servings}"
+                if self.metadata.servings else ""
+            ),
+            "notes_block": (
+                "\n\n**Notes:**\n" + "\n".join(f"• {note}" for note in self.notes)
+                if self.notes else ""
+            ),
+            "source_url": self.metadata.source_url,
+        })
         
         return {
             "title": f"Recipe: {self.metadata.title}",
@@ -112,10 +109,4 @@ class ExtractionResult(BaseModel):
     recipe: Optional[Recipe] = Field(None, description="Extracted recipe data")
     error: Optional[str] = Field(None, description="Error message if extraction failed")
     warnings: List[str] = Field(default_factory=list, description="Non-fatal warnings")
-    extraction_time: float = Field(..., description="Time taken for extraction in seconds")
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
\ No newline at end of file
+    extraction_time: float = Field(..., description="Time taken for extraction in seconds")
\ No newline at end of file
@@ -1,24 +1,77 @@
 """MCP Server implementation for recipe extraction."""
 
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from fastmcp import FastMCP
-from pydantic import BaseModel, Field, HttpUrl
+import anyio
+from cachetools import TTLCache
+from fastmcp import Context, FastMCP
+from pydantic import BaseModel, ConfigDict, Field
 
 from .models import Recipe, ExtractionResult
-from .extractor import NYTCookingExtractor
+from .extractor import DEFAULT_STORAGE_STATE_PATH, NYTCookingExtractor
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 logger = logging.getLogger(__name__)
 
+_NYT_RECIPE_PREFIX = "https://cooking.nytimes.com/recipes/"
+
+_NYT_RECIPE_RE = re.compile(
+    re.escape(_NYT_RECIPE_PREFIX) + r'(?P<recipe_id>\d+)-(?P<slug>[A-Za-z0-9\-]+)'
+)
+
+# Static validate_nyt_url rejections; copied per call so callers can't mutate them
+_NOT_NYT_URL_RESULT: Dict[str, Any] = {
+    "valid": False,
+    "reason": "Not a NYT Cooking recipe URL",
+    "expected_format": "https://cooking.nytimes.com/recipes/{recipe-id}-{recipe-name}"
+}
+
+_INVALID_RECIPE_ID_RESULT: Dict[str, Any] = {
+    "valid": False,
+    "reason": "Invalid recipe identifier format",
+    "expected_format": "Recipe ID should contain numbers and recipe name"
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def _check_recipe_url(url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Classify a URL for validate_nyt_url.
+    
+    Agents tend to validate the same URLs repeatedly, so results are cached.
+    
+    Args:
+        url: URL to classify
+        
+    Returns:
+        Tuple of the static rejection response (None if valid) and the
+        recipe ID (None if invalid)
+    """
+    match = _NYT_RECIPE_RE.match(url)
+    if match:
+        return None, match.group('recipe_id')
+    
+    # Check if it's a NYT Cooking URL at all
+    if not url.startswith(_NYT_RECIPE_PREFIX):
+        return _NOT_NYT_URL_RESULT, None
+    return _INVALID_RECIPE_ID_RESULT, None
+
 
 class ExtractRecipeArgs(BaseModel):
     """Arguments for recipe extraction."""
     
-    url: HttpUrl = Field(..., description="NYT Cooking recipe URL to extract")
+    model_config = ConfigDict(frozen=True)
+    
+    url: str = Field(..., description="NYT Cooking recipe URL to extract")
     include_nutrition: bool = Field(
         default=True, 
         description="Whether to extract nutritional information"
@@ -33,21 +86,59 @@ class ExtractRecipeArgs(BaseModel):
     )
 
 
+class ExtractRecipesArgs(BaseModel):
+    """Arguments for extracting several recipes."""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    urls: List[str] = Field(..., description="NYT Cooking recipe URLs to extract")
+    include_nutrition: bool = Field(
+        default=True, 
+        description="Whether to extract nutritional information"
+    )
+    include_reviews: bool = Field(
+        default=False,
+        description="Whether to extract review information"
+    )
+    timeout: int = Field(
+        default=30,
+        description="Timeout in seconds for each extraction"
+    )
+
+
 class RecipeMCPServer:
     """MCP Server for NYT Cooking recipe extraction."""
     
-    def __init__(self, headless: bool = True, debug: bool = False):
+    def __init__(
+        self,
+        headless: bool = True,
+        debug: bool = False,
+        pool_size: int = 2,
+        storage_state_path: Optional[str] = DEFAULT_STORAGE_STATE_PATH
+    ):
         """Initialize the MCP server.
         
         Args:
             headless: Whether to run browser in headless mode
             debug: Enable debug logging
+            pool_size: Number of browser pages available for concurrent extractions
+            storage_state_path: File used to persist browser cookies between
+                runs, or None to disable persistence
         """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+        
         self.app = FastMCP("Recipe MCP Server")
         self.headless = headless
         self.debug = debug
+        self.pool_size = pool_size
+        self.storage_state_path = storage_state_path
         self.extractor: Optional[NYTCookingExtractor] = None
         
+        # Successful results keyed by (url, include_nutrition, include_reviews)
+        self._result_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+        self._inflight: Dict[Tuple[str, bool, bool], asyncio.Task] = {}
+        
         if debug:
             logging.basicConfig(level=logging.DEBUG)
         
@@ -78,13 +169,12 @@ class RecipeMCPServer:
                 )
             
             try:
-                result = await self.extractor.extract_recipe(
-                    url=str(args.url),
+                return await self._extract_cached(
+                    url=args.url,
                     include_nutrition=args.include_nutrition,
                     include_reviews=args.include_reviews,
                     timeout=args.timeout
                 )
-                return result
                 
             except Exception as e:
                 logger.exception("Failed to extract recipe")
@@ -95,7 +185,66 @@ class RecipeMCPServer:
                 )
         
         @self.app.tool()
-        async def validate_nyt_url(url: HttpUrl) -> Dict[str, Any]:
+        async def extract_recipes(
+            args: ExtractRecipesArgs,
+            ctx: Context
+        ) -> List[ExtractionResult]:
+            """Extract several recipes from NYT Cooking URLs concurrently.
+            
+            Runs the same extraction as extract_recipe for each URL, overlapping
+            page loads across a small number of browser pages. Progress is
+            reported as each recipe finishes.
+            
+            Args:
+                args: Extraction parameters including URLs and options
+                ctx: Request context used for progress notifications
+                
+            Returns:
+                ExtractionResults in the same order as the requested URLs
+            """
+            if not self.extractor:
+                return [
+                    ExtractionResult(
+                        success=False,
+                        error="Extractor not initialized",
+                        extraction_time=0.0
+                    )
+                    for _ in args.urls
+                ]
+            
+            total = len(args.urls)
+            done = 0
+            semaphore = asyncio.Semaphore(self.pool_size)
+            
+            async def extract_one(url: str) -> ExtractionResult:
+                nonlocal done
+                # Share the cache and in-flight extractions with extract_recipe,
+                # so repeated URLs only load their page once
+                try:
+                    async with semaphore:
+                        result = await self._extract_cached(
+                            url,
+                            args.include_nutrition,
+                            args.include_reviews,
+                            args.timeout
+                        )
+                except Exception as e:
+                    # Report the failure for this URL rather than the whole batch
+                    logger.exception("Failed to extract recipe")
+                    result = ExtractionResult(
+                        success=False,
+                        error=f"Extraction failed: {str(e)}",
+                        extraction_time=0.0
+                    )
+                done += 1
+                outcome = "Extracted" if result.success else "Failed to extract"
+                await ctx.report_progress(done, total, f"{outcome} {url}")
+                return result
+            
+            return list(await asyncio.gather(*(extract_one(url) for url in args.urls)))
+        
+        @self.app.tool()
+        async def validate_nyt_url(url: str) -> Dict[str, Any]:
             """Validate if URL is a supported NYT Cooking recipe URL.
             
             This tool checks if the provided URL is a valid NYT Cooking recipe
@@ -107,37 +256,14 @@ class RecipeMCPServer:
             Returns:
                 Dictionary with validation result and details
             """
-            url_str = str(url)
-            
-            # Check if it's a NYT Cooking URL
-            if not url_str.startswith("https://cooking.nytimes.com/recipes/"):
-                return {
-                    "valid": False,
-                    "reason": "Not a NYT Cooking recipe URL",
-                    "expected_format": "https://cooking.nytimes.com/recipes/{recipe-id}-{recipe-name}"
-                }
-            
-            # Basic format validation
-            parts = url_str.split("/")
-            if len(parts) < 5:
-                return {
-                    "valid": False,
-                    "reason": "Invalid URL format",
-                    "expected_format": "https://cooking.nytimes.com/recipes/{recipe-id}-{recipe-name}"
-                }
-            
-            recipe_part = parts[4]
-            if not recipe_part or "-" not in recipe_part:
-                return {
-                    "valid": False,
-                    "reason": "Invalid recipe identifier format",
-                    "expected_format": "Recipe ID should contain numbers and recipe name"
-                }
+            rejection, recipe_id = _check_recipe_url(url)
+            if rejection is not None:
+                return dict(rejection)
             
             return {
                 "valid": True,
-                "url": url_str,
-                "recipe_id": recipe_part.split("-")[0] if "-" in recipe_part else None
+                "url": url,
+                "recipe_id": recipe_id
             }
         
         @self.app.tool()
@@ -155,9 +281,72 @@ class RecipeMCPServer:
                 "extractor_initialized": self.extractor is not None,
                 "headless_mode": self.headless,
                 "debug_mode": self.debug,
+                "pool_size": self.pool_size,
                 "supported_sites": ["cooking.nytimes.com"]
             }
     
+    async def _extract_cached(
+        self,
+        url: str,
+        include_nutrition: bool,
+        include_reviews: bool,
+        timeout: int
+    ) -> ExtractionResult:
+        """Extract a recipe, reusing recent results.
+        
+        Concurrent requests for the same recipe share a single extraction
+        instead of each loading the page.
+        
+        Args:
+            url: Recipe URL to extract
+            include_nutrition: Whether to extract nutrition info
+            include_reviews: Whether to extract review info
+            timeout: Timeout in seconds
+            
+        Returns:
+            ExtractionResult with recipe data or error
+        """
+        key = (url, include_nutrition, include_reviews)
+        
+        # Callers get their own copy so they can't alter the cached result
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        
+        task = self._inflight.get(key)
+        if task is None:
+            # stop() may have run while this request waited for a slot
+            if not self.extractor:
+                return ExtractionResult(
+                    success=False,
+                    error="Extractor not initialized",
+                    extraction_time=0.0
+                )
+            task = asyncio.ensure_future(self.extractor.extract_recipe(
+                url=url,
+                include_nutrition=include_nutrition,
+                include_reviews=include_reviews,
+                timeout=timeout
+            ))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish_extraction, key))
+        
+        # Shield so one caller cancelling doesn't abort the shared extraction
+        result = await asyncio.shield(task)
+        return result.model_copy(deep=True)
+    
+    def _finish_extraction(self, key: Tuple[str, bool, bool], task: asyncio.Task):
+        """Cache a completed extraction and clear its in-flight entry."""
+        self._inflight.pop(key, None)
+        
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        # Only cache successes so failed extractions are retried
+        result = task.result()
+        if result.success:
+            self._result_cache[key] = result
+    
     async def start(self):
         """Start the MCP server and initialize components."""
         logger.info("Starting Recipe MCP Server")
@@ -165,7 +354,9 @@ class RecipeMCPServer:
         # Initialize the extractor
         self.extractor = NYTCookingExtractor(
             headless=self.headless,
-            debug=self.debug
+            debug=self.debug,
+            page_pool_size=self.pool_size,
+            storage_state_path=self.storage_state_path
         )
         await self.extractor.start()
         
@@ -175,6 +366,13 @@ class RecipeMCPServer:
         """Stop the MCP server and cleanup resources."""
         logger.info("Stopping Recipe MCP Server")
         
+        # Cancel in-flight extractions so their pages are released before
+        # the browser context closes underneath them
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
         if self.extractor:
             await self.extractor.stop()
             self.extractor = None
@@ -197,14 +395,21 @@ class RecipeMCPServer:
             host: Host to bind to
             port: Port to bind to
         """
-        async def main():
-            async with self.lifespan():
-                await self.app.run(host=host, port=port)
-        
-        asyncio.run(main())
+        # Use the libuv event loop when the optional uvloop extra is installed
+        anyio.run(
+            self._serve,
+            host,
+            port,
+            backend_options={"use_uvloop": uvloop is not None}
+        )
+    
+    async def _serve(self, host: str, port: int):
+        """Serve MCP over HTTP for the lifetime of the extractor."""
+        async with self.lifespan():
+            await self.app.run_async(transport="http", host=host, port=port)
 
 
-async def main():
+def main():
     """Main entry point for the MCP server."""
     import argparse
     
@@ -230,12 +435,27 @@ async def main():
         action="store_true", 
         help="Enable debug logging"
     )
+    parser.add_argument(
+        "--pool-size", 
+        type=int, 
+        default=2, 
+        help="Browser pages available for concurrent extractions (default: 2)"
+    )
+    parser.add_argument(
+        "--no-storage-state", 
+        action="store_true", 
+        help="Don't save or restore browser cookies between runs"
+    )
     
     args = parser.parse_args()
+    if args.pool_size < 1:
+        parser.error("--pool-size must be at least 1")
     
     server = RecipeMCPServer(
         headless=not args.no_headless,
-        debug=args.debug
+        debug=args.debug,
+        pool_size=args.pool_size,
+        storage_state_path=None if args.no_storage_state else DEFAULT_STORAGE_STATE_PATH
     )
     
     try:
@@ -245,4 +465,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,411 @@
+"""Tests for recipe extraction parsing."""
+
+import asyncio
+import os
+import stat
+from typing import List, Optional
+
+import orjson
+import pytest
+
+from recipe_mcp.extractor import NYTCookingExtractor
+
+
+RECIPE_HTML = """
+<html>
+<body>
+  <header data-testid="recipe-header">
+    <h1 data-testid="recipe-title">Test Recipe</h1>
+    <span data-testid="recipe-author">Test Chef</span>
+  </header>
+  <div data-testid="recipe-servings">4 servings</div>
+  <ul>
+    <li data-testid="recipe-ingredient">2 cups flour</li>
+    <li data-testid="recipe-ingredient">1 cup sugar</li>
+  </ul>
+  <ol>
+    <li data-testid="recipe-instruction">Mix flour and sugar</li>
+    <li data-testid="recipe-instruction">Bake for 20 minutes</li>
+  </ol>
+  <div data-testid="recipe-rating">4.5 out of 5</div>
+  <div data-testid="recipe-review-count">1,234 reviews</div>
+  <section data-testid="nutrition-summary">
+    <div class="nutrition-item">
+      <span class="nutrition-label">Calories</span>
+      <span class="nutrition-value">250 kcal</span>
+    </div>
+    <div class="nutrition-item"><dt>Protein</dt><dd>10g</dd></div>
+  </section>
+</body>
+</html>
+"""
+
+
+JSONLD_PAYLOADS = [
+    '{"@type": "WebSite", "name": "NYT Cooking"}',
+    """
+    {
+      "@context": "https://schema.org",
+      "@type": "Recipe",
+      "name": "Chocolate Chip Cookies",
+      "author": {"@type": "Person", "name": "Test Chef"},
+      "description": "Classic cookies",
+      "prepTime": "PT15M",
+      "totalTime": "PT1H30M",
+      "recipeYield": "24 cookies",
+      "keywords": "cookies, dessert",
+      "recipeIngredient": ["2 cups flour", "1 cup sugar"],
+      "recipeInstructions": [
+        {"@type": "HowToStep", "text": "Mix flour and sugar"},
+        {
+          "@type": "HowToSection",
+          "itemListElement": [{"@type": "HowToStep", "text": "Bake for 20 minutes"}]
+        }
+      ],
+      "nutrition": {"calories": "250", "proteinContent": "3 grams"},
+      "aggregateRating": {"ratingValue": "4.5", "ratingCount": "1234"}
+    }
+    """,
+]
+
+
+class FakePage:
+    """Minimal stand-in for a Playwright page."""
+
+    def __init__(self, html: str, jsonld: Optional[List[str]] = None):
+        self.html = html
+        self.jsonld = jsonld or []
+
+    async def content(self) -> str:
+        return self.html
+
+    async def evaluate(self, expression: str) -> List[str]:
+        return self.jsonld
+
+
+@pytest.fixture
+def extractor():
+    """Extractor instance that is never started."""
+    return NYTCookingExtractor()
+
+
+class TestExtractRecipeData:
+    """Tests for page data extraction."""
+
+    async def test_data_testid_fields(self, extractor):
+        """Test fields located by data-testid attribute selectors."""
+        data = await extractor._extract_recipe_data(FakePage(RECIPE_HTML))
+
+        assert data["title"] == "Test Recipe"
+        assert data["author"] == "Test Chef"
+        assert data["servings"] == "4 servings"
+        assert data["ingredients"] == ["2 cups flour", "1 cup sugar"]
+        assert data["instructions"] == ["Mix flour and sugar", "Bake for 20 minutes"]
+
+    async def test_nutrition(self, extractor):
+        """Test nutrition labels given as dt/dd pairs or classed spans."""
+        data = await extractor._extract_recipe_data(FakePage(RECIPE_HTML))
+
+        assert data["nutrition"] == {"calories": 250, "protein": "10g"}
+
+    async def test_reviews(self, extractor):
+        """Test rating and review count extraction."""
+        data = await extractor._extract_recipe_data(
+            FakePage(RECIPE_HTML),
+            include_reviews=True
+        )
+
+        assert data["rating"] == 4.5
+        assert data["review_count"] == 1234
+
+    async def test_reviews_excluded_by_default(self, extractor):
+        """Test review fields are skipped unless requested."""
+        data = await extractor._extract_recipe_data(FakePage(RECIPE_HTML))
+
+        assert "rating" not in data
+        assert "review_count" not in data
+
+
+class TestExtractJsonLd:
+    """Tests for schema.org JSON-LD extraction."""
+
+    def test_recipe_fields(self, extractor):
+        """Test mapping of Recipe JSON-LD fields."""
+        data = extractor._extract_jsonld(JSONLD_PAYLOADS)
+
+        assert data["title"] == "Chocolate Chip Cookies"
+        assert data["author"] == "Test Chef"
+        assert data["description"] == "Classic cookies"
+        assert data["prep_time"] == "15 minutes"
+        assert data["total_time"] == "1 hour 30 minutes"
+        assert data["servings"] == "24 cookies"
+        assert data["tags"] == ["cookies", "dessert"]
+        assert data["ingredients"] == ["2 cups flour", "1 cup sugar"]
+        assert data["instructions"] == ["Mix flour and sugar", "Bake for 20 minutes"]
+        assert data["nutrition"] == {"calories": 250, "protein": "3 grams"}
+        assert "rating" not in data
+
+    def test_reviews(self, extractor):
+        """Test aggregate rating extraction."""
+        data = extractor._extract_jsonld(JSONLD_PAYLOADS, include_reviews=True)
+
+        assert data["rating"] == 4.5
+        assert data["review_count"] == 1234
+
+    def test_graph_payload(self, extractor):
+        """Test Recipe objects nested in an @graph list."""
+        payload = (
+            '{"@graph": [{"@type": ["Recipe"], "name": "Soup",'
+            ' "recipeIngredient": ["1 onion"], "recipeInstructions": "Simmer"}]}'
+        )
+        data = extractor._extract_jsonld([payload])
+
+        assert data["title"] == "Soup"
+        assert data["instructions"] == ["Simmer"]
+
+    def test_single_text_ingredient(self, extractor):
+        """Test a recipeIngredient given as one string instead of a list."""
+        payload = '{"@type": "Recipe", "name": "Toast", "recipeIngredient": "1 cup flour"}'
+        data = extractor._extract_jsonld([payload])
+
+        assert data["ingredients"] == ["1 cup flour"]
+
+    def test_unexpected_field_types_are_skipped(self, extractor):
+        """Test non-string values are ignored rather than raising."""
+        payload = (
+            '{"@type": "Recipe", "name": {"text": "Soup"}, "prepTime": ["PT5M"],'
+            ' "keywords": ["soup", 1], "recipeIngredient": ["1 onion"]}'
+        )
+        data = extractor._extract_jsonld([payload])
+
+        assert "title" not in data
+        assert "prep_time" not in data
+        assert data["tags"] == ["soup"]
+
+    def test_no_recipe(self, extractor):
+        """Test pages without a Recipe payload."""
+        assert extractor._extract_jsonld([]) is None
+        assert extractor._extract_jsonld(["not json", '{"@type": "WebSite"}']) is None
+
+    async def test_preferred_over_dom(self, extractor):
+        """Test the JSON-LD payload is used before DOM scraping."""
+        data = await extractor._extract_recipe_data(FakePage(RECIPE_HTML, jsonld=JSONLD_PAYLOADS))
+
+        assert data["title"] == "Chocolate Chip Cookies"
+
+    async def test_falls_back_to_dom_on_error(self, extractor, monkeypatch):
+        """Test a payload that fails to map falls back to DOM scraping."""
+        def fail(*args, **kwargs):
+            raise TypeError("unexpected payload")
+
+        monkeypatch.setattr(extractor, "_extract_jsonld", fail)
+        data = await extractor._extract_recipe_data(FakePage(RECIPE_HTML, jsonld=JSONLD_PAYLOADS))
+
+        assert data["title"] == "Test Recipe"
+
+
+class TestInit:
+    """Tests for extractor construction."""
+
+    def test_rejects_empty_page_pool(self):
+        """Test a pool size below one is refused."""
+        with pytest.raises(ValueError):
+            NYTCookingExtractor(page_pool_size=0)
+
+
+class BrokenPage:
+    """Page whose browser has crashed."""
+
+    def is_closed(self):
+        return False
+
+    async def goto(self, url, **kwargs):
+        raise RuntimeError("Target crashed")
+
+    async def close(self):
+        pass
+
+
+class TestPagePool:
+    """Tests for page pool checkout and release."""
+
+    async def test_checkout_times_out(self, extractor):
+        """Test an exhausted pool fails the extraction instead of hanging."""
+        extractor.context = object()
+        extractor._page_pool = asyncio.Queue()
+
+        result = await extractor.extract_recipe(
+            "https://cooking.nytimes.com/recipes/1-soup",
+            timeout=0.01
+        )
+
+        assert not result.success
+        assert "waiting for a browser page" in result.error
+
+    async def test_unreplaceable_page_keeps_its_slot(self, extractor, monkeypatch):
+        """Test a failed page replacement leaves a slot that is refilled lazily."""
+        async def fail():
+            raise RuntimeError("Browser closed")
+
+        extractor.context = object()
+        extractor._page_pool = asyncio.Queue()
+        monkeypatch.setattr(extractor, "_new_page", fail)
+
+        await extractor._release_page(BrokenPage())
+
+        assert extractor._page_pool.qsize() == 1
+        assert extractor._page_pool.get_nowait() is None
+
+        extractor._page_pool.put_nowait(None)
+        result = await extractor.extract_recipe(
+            "https://cooking.nytimes.com/recipes/1-soup",
+            timeout=0.01
+        )
+
+        assert result.error == "Extraction error: Browser closed"
+        assert extractor._page_pool.qsize() == 1
+
+
+class TestExtractMany:
+    """Tests for batched extraction."""
+
+    async def test_results_keep_url_order(self, extractor):
+        """Test one result is returned per URL, in request order."""
+        urls = [
+            "https://example.com/recipes/1-soup",
+            "https://cooking.nytimes.com/recipes/1234-test-recipe",
+        ]
+        results = await extractor.extract_many(urls)
+
+        assert len(results) == 2
+        assert all(not result.success for result in results)
+        assert results[0].error == "Extractor not started"
+
+
+class TestParseIngredient:
+    """Tests for ingredient parsing."""
+
+    def test_quantity_unit_name_preparation(self, extractor):
+        """Test a fully specified ingredient."""
+        ingredient = extractor._parse_ingredient("2 cups flour, sifted")
+
+        assert ingredient.quantity == "2"
+        assert ingredient.unit == "cups"
+        assert ingredient.name == "flour"
+        assert ingredient.preparation == "sifted"
+        assert ingredient.raw_text == "2 cups flour, sifted"
+
+    @pytest.mark.parametrize("quantity", ["2", "1.5", "½", "1½", "1/2", "2-3", "¼-½"])
+    def test_quantities(self, extractor, quantity):
+        """Test numbers, unicode fractions, fractions and ranges."""
+        ingredient = extractor._parse_ingredient(f"{quantity} cups flour")
+
+        assert ingredient.quantity == quantity
+        assert ingredient.unit == "cups"
+        assert ingredient.name == "flour"
+
+    @pytest.mark.parametrize("text", ["salt", "2x4 boards", "inf cups flour"])
+    def test_no_quantity(self, extractor, text):
+        """Test ingredients without a leading quantity."""
+        ingredient = extractor._parse_ingredient(text)
+
+        assert ingredient.quantity is None
+        assert ingredient.unit is None
+        assert ingredient.name == text
+
+    def test_unit_case_and_punctuation(self, extractor):
+        """Test unit matching ignores case and trailing punctuation."""
+        ingredient = extractor._parse_ingredient("1 Tbsp. olive oil")
+
+        assert ingredient.unit == "Tbsp."
+        assert ingredient.name == "olive oil"
+
+    def test_no_unit(self, extractor):
+        """Test a quantity followed directly by the name."""
+        ingredient = extractor._parse_ingredient("2 large eggs")
+
+        assert ingredient.quantity == "2"
+        assert ingredient.unit is None
+        assert ingredient.name == "large eggs"
+
+    @pytest.mark.parametrize("text,quantity,unit", [
+        ("1/4 teaspoon", "1/4", "teaspoon"),
+        ("2 cups", "2", "cups"),
+        ("2", "2", None),
+    ])
+    def test_quantity_or_unit_ends_text(self, extractor, text, quantity, unit):
+        """Test a trailing quantity or unit is still recognised."""
+        ingredient = extractor._parse_ingredient(text)
+
+        assert ingredient.quantity == quantity
+        assert ingredient.unit == unit
+        assert ingredient.name == text
+
+    def test_parenthetical_preparation(self, extractor):
+        """Test parenthetical notes take precedence over commas."""
+        ingredient = extractor._parse_ingredient("1/2 cup (1 stick) butter, softened")
+
+        assert ingredient.name == "butter, softened"
+        assert ingredient.preparation == "1 stick"
+
+
+class TestIsValidNytUrl:
+    """Tests for NYT Cooking URL validation."""
+
+    @pytest.mark.parametrize("url", [
+        "https://cooking.nytimes.com/recipes/1018069-chocolate-chip-cookies",
+        "http://cooking.nytimes.com/recipes/1018069",
+    ])
+    def test_valid(self, extractor, url):
+        """Test recipe URLs on cooking.nytimes.com."""
+        assert extractor._is_valid_nyt_url(url)
+
+    @pytest.mark.parametrize("url", [
+        "https://cooking.nytimes.com/guides/1-how-to-make-soup",
+        "https://www.nytimes.com/recipes/1018069",
+        "https://cooking.nytimes.com.example.com/recipes/1",
+        "not-a-url",
+    ])
+    def test_invalid(self, extractor, url):
+        """Test other paths, hosts and malformed URLs."""
+        assert not extractor._is_valid_nyt_url(url)
+
+
+class FakeContext:
+    """Minimal stand-in for a Playwright browser context."""
+
+    async def storage_state(self):
+        return {"cookies": [{"name": "session", "value": "secret"}], "origins": []}
+
+
+class TestSaveStorageState:
+    """Tests for persisting the browser session."""
+
+    async def test_bare_filename(self, tmp_path, monkeypatch):
+        """Test a path without a directory is written to the working directory."""
+        monkeypatch.chdir(tmp_path)
+        extractor = NYTCookingExtractor(storage_state_path="state.json")
+        extractor.context = FakeContext()
+
+        await extractor._save_storage_state()
+
+        state = orjson.loads((tmp_path / "state.json").read_bytes())
+        assert state["cookies"][0]["value"] == "secret"
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    async def test_owner_only_permissions(self, tmp_path):
+        """Test the directory and file are not readable by other users."""
+        path = tmp_path / "cache" / "state.json"
+        path.parent.mkdir(mode=0o755)
+        path.write_text("{}")
+        path.chmod(0o644)
+        (tmp_path / "new").mkdir()
+        new_path = tmp_path / "new" / "sub" / "state.json"
+
+        for target in (path, new_path):
+            extractor = NYTCookingExtractor(storage_state_path=str(target))
+            extractor.context = FakeContext()
+            await extractor._save_storage_state()
+
+            assert stat.S_IMODE(target.stat().st_mode) == 0o600
+        assert stat.S_IMODE(new_path.parent.stat().st_mode) == 0o700
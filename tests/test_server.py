@@ -0,0 +1,320 @@
+"""Tests for MCP server tools."""
+
+import asyncio
+
+import pytest
+from fastmcp import Context
+
+from recipe_mcp.models import ExtractionResult, Recipe, RecipeMetadata
+from recipe_mcp.server import RecipeMCPServer
+
+
+RECIPE_URL = "https://cooking.nytimes.com/recipes/1018069-chocolate-chip-cookies"
+
+
+class StubExtractor:
+    """Extractor stand-in that records the URLs it is asked to load."""
+
+    def __init__(self, succeed: bool = True):
+        self.succeed = succeed
+        self.calls = []
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+    async def extract_recipe(self, url, include_nutrition=True, include_reviews=False, timeout=30):
+        self.calls.append(url)
+        await asyncio.sleep(0)
+        if not self.succeed:
+            return ExtractionResult(success=False, error="boom", extraction_time=0.1)
+        recipe = Recipe(
+            metadata=RecipeMetadata(source_url=url, title="Test Recipe"),
+            ingredients=[],
+            instructions=[]
+        )
+        return ExtractionResult(success=True, recipe=recipe, extraction_time=0.1)
+
+
+@pytest.fixture
+def server():
+    """Server instance whose extractor is never started."""
+    return RecipeMCPServer()
+
+
+async def call_tool(server, name, arguments):
+    """Call a registered tool and return its structured result."""
+    result = await server.app.call_tool(name, arguments)
+    return result.structured_content
+
+
+class TestValidateNytUrl:
+    """Tests for the validate_nyt_url tool."""
+
+    async def test_valid_url(self, server):
+        """Test a well-formed recipe URL."""
+        url = "https://cooking.nytimes.com/recipes/1018069-chocolate-chip-cookies"
+        result = await call_tool(server, "validate_nyt_url", {"url": url})
+
+        assert result == {"valid": True, "url": url, "recipe_id": "1018069"}
+
+    async def test_other_site(self, server):
+        """Test a URL outside NYT Cooking recipes."""
+        result = await call_tool(
+            server, "validate_nyt_url", {"url": "https://example.com/recipes/1-soup"}
+        )
+
+        assert result["valid"] is False
+        assert result["reason"] == "Not a NYT Cooking recipe URL"
+
+    async def test_bad_recipe_identifier(self, server):
+        """Test a recipe path without a numeric id and name."""
+        result = await call_tool(
+            server,
+            "validate_nyt_url",
+            {"url": "https://cooking.nytimes.com/recipes/chocolate"}
+        )
+
+        assert result["valid"] is False
+        assert result["reason"] == "Invalid recipe identifier format"
+
+    async def test_malformed_url(self, server):
+        """Test a string that is not a URL at all."""
+        result = await call_tool(server, "validate_nyt_url", {"url": "not-a-url"})
+
+        assert result["valid"] is False
+        assert result["reason"] == "Not a NYT Cooking recipe URL"
+
+
+class TestInit:
+    """Tests for server construction."""
+
+    @pytest.mark.parametrize("pool_size", [0, -1])
+    def test_rejects_empty_pool(self, pool_size):
+        """Test a pool without pages is refused instead of hanging later."""
+        with pytest.raises(ValueError):
+            RecipeMCPServer(pool_size=pool_size)
+
+
+class TestGetServerStatus:
+    """Tests for the get_server_status tool."""
+
+    async def test_status_before_start(self):
+        """Test status reflects configuration before the extractor starts."""
+        server = RecipeMCPServer(pool_size=3)
+        result = await call_tool(server, "get_server_status", {})
+
+        assert result["extractor_initialized"] is False
+        assert result["headless_mode"] is True
+        assert result["pool_size"] == 3
+
+
+class TestNotInitialized:
+    """Tests for tools called before the server is started."""
+
+    async def test_extract_recipe(self, server):
+        """Test extract_recipe reports the missing extractor."""
+        result = await call_tool(server, "extract_recipe", {"args": {"url": RECIPE_URL}})
+
+        assert result["success"] is False
+        assert result["error"] == "Extractor not initialized"
+
+    async def test_extract_recipes(self, server):
+        """Test extract_recipes returns one error per URL."""
+        result = await call_tool(
+            server, "extract_recipes", {"args": {"urls": [RECIPE_URL, RECIPE_URL]}}
+        )
+
+        assert [r["error"] for r in result["result"]] == ["Extractor not initialized"] * 2
+
+
+class TestExtractionCache:
+    """Tests for extraction result caching."""
+
+    async def test_concurrent_requests_share_extraction(self, server):
+        """Test identical in-flight requests are coalesced and then cached."""
+        server.extractor = StubExtractor()
+
+        first, second = await asyncio.gather(
+            server._extract_cached(RECIPE_URL, True, False, 30),
+            server._extract_cached(RECIPE_URL, True, False, 30),
+        )
+        third = await server._extract_cached(RECIPE_URL, True, False, 30)
+
+        assert server.extractor.calls == [RECIPE_URL]
+        assert first == second == third
+        assert not server._inflight
+
+    async def test_callers_get_independent_copies(self, server):
+        """Test mutating a returned result leaves the cached one untouched."""
+        server.extractor = StubExtractor()
+
+        first = await server._extract_cached(RECIPE_URL, True, False, 30)
+        first.warnings.append("changed")
+        second = await server._extract_cached(RECIPE_URL, True, False, 30)
+
+        assert second.warnings == []
+
+    async def test_options_are_part_of_key(self, server):
+        """Test different extraction options are cached separately."""
+        server.extractor = StubExtractor()
+
+        await server._extract_cached(RECIPE_URL, True, False, 30)
+        await server._extract_cached(RECIPE_URL, True, True, 30)
+
+        assert server.extractor.calls == [RECIPE_URL, RECIPE_URL]
+
+    async def test_failures_are_not_cached(self, server):
+        """Test failed extractions are retried on the next request."""
+        server.extractor = StubExtractor(succeed=False)
+
+        await server._extract_cached(RECIPE_URL, True, False, 30)
+        result = await server._extract_cached(RECIPE_URL, True, False, 30)
+
+        assert result.success is False
+        assert server.extractor.calls == [RECIPE_URL, RECIPE_URL]
+
+    async def test_batch_extracts_only_uncached_urls(self, server):
+        """Test extract_recipes reuses cached results."""
+        other_url = "https://cooking.nytimes.com/recipes/1015819-soup"
+        server.extractor = StubExtractor()
+        await server._extract_cached(RECIPE_URL, True, False, 30)
+
+        result = await call_tool(
+            server, "extract_recipes", {"args": {"urls": [other_url, RECIPE_URL]}}
+        )
+
+        assert server.extractor.calls == [RECIPE_URL, other_url]
+        assert [r["recipe"]["metadata"]["source_url"] for r in result["result"]] == [
+            other_url,
+            RECIPE_URL,
+        ]
+
+
+class TestExtractRecipesCoalescing:
+    """Tests for extract_recipes sharing work with other requests."""
+
+    async def test_duplicate_urls_extracted_once(self, server):
+        """Test a URL repeated in one batch loads its page once."""
+        server.extractor = StubExtractor()
+
+        result = await call_tool(
+            server, "extract_recipes", {"args": {"urls": [RECIPE_URL, RECIPE_URL]}}
+        )
+
+        assert server.extractor.calls == [RECIPE_URL]
+        assert [r["success"] for r in result["result"]] == [True, True]
+
+    async def test_shares_extraction_with_extract_recipe(self, server):
+        """Test concurrent single and batch calls for a URL share one extraction."""
+        server.extractor = StubExtractor()
+
+        await asyncio.gather(
+            call_tool(server, "extract_recipe", {"args": {"url": RECIPE_URL}}),
+            call_tool(server, "extract_recipes", {"args": {"urls": [RECIPE_URL]}}),
+        )
+
+        assert server.extractor.calls == [RECIPE_URL]
+
+
+class TestExtractRecipesErrors:
+    """Tests for failures inside a batch."""
+
+    async def test_failure_is_reported_per_url(self, server):
+        """Test one URL raising doesn't discard the other results."""
+        other_url = "https://cooking.nytimes.com/recipes/1015819-soup"
+        extractor = StubExtractor()
+        succeed = extractor.extract_recipe
+
+        async def extract_recipe(url, **kwargs):
+            if url == other_url:
+                raise RuntimeError("page crashed")
+            return await succeed(url, **kwargs)
+
+        extractor.extract_recipe = extract_recipe
+        server.extractor = extractor
+
+        result = await call_tool(
+            server, "extract_recipes", {"args": {"urls": [other_url, RECIPE_URL]}}
+        )
+
+        assert result["result"][0]["success"] is False
+        assert result["result"][0]["error"] == "Extraction failed: page crashed"
+        assert result["result"][1]["success"] is True
+
+    async def test_progress_reports_outcome(self, server, monkeypatch):
+        """Test progress messages say whether each extraction succeeded."""
+        messages = []
+
+        async def report_progress(self, progress, total=None, message=None):
+            messages.append((progress, total, message))
+
+        monkeypatch.setattr(Context, "report_progress", report_progress)
+        server.extractor = StubExtractor(succeed=False)
+
+        await call_tool(server, "extract_recipes", {"args": {"urls": [RECIPE_URL]}})
+
+        assert messages == [(1, 1, f"Failed to extract {RECIPE_URL}")]
+
+    async def test_extractor_stopped_while_waiting(self, server):
+        """Test requests reaching the extractor after stop() get an error result."""
+        result = await server._extract_cached(RECIPE_URL, True, False, 30)
+
+        assert result.success is False
+        assert result.error == "Extractor not initialized"
+
+
+class TestStop:
+    """Tests for server shutdown."""
+
+    async def test_cancels_inflight_extractions(self, server):
+        """Test pending extractions are cancelled before the extractor stops."""
+        extractor = StubExtractor()
+        blocked = asyncio.Event()
+
+        async def extract_recipe(url, **kwargs):
+            await blocked.wait()
+
+        extractor.extract_recipe = extract_recipe
+        server.extractor = extractor
+        request = asyncio.ensure_future(server._extract_cached(RECIPE_URL, True, False, 30))
+        await asyncio.sleep(0)
+        task = server._inflight[(RECIPE_URL, True, False)]
+
+        await server.stop()
+
+        assert task.cancelled()
+        assert not server._inflight
+        assert extractor.stopped
+        assert server.extractor is None
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+
+class TestRun:
+    """Tests for the blocking run entry point."""
+
+    def test_serves_inside_lifespan(self, server, monkeypatch):
+        """Test the extractor is started before serving and stopped after."""
+        calls = []
+
+        async def start():
+            calls.append("start")
+
+        async def stop():
+            calls.append("stop")
+
+        async def run_async(**kwargs):
+            calls.append(("run_async", kwargs))
+
+        monkeypatch.setattr(server, "start", start)
+        monkeypatch.setattr(server, "stop", stop)
+        monkeypatch.setattr(server.app, "run_async", run_async)
+
+        server.run(host="127.0.0.1", port=8123)
+
+        assert calls == [
+            "start",
+            ("run_async", {"transport": "http", "host": "127.0.0.1", "port": 8123}),
+            "stop",
+        ]